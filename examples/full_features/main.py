@@ -4,22 +4,58 @@ import json
 import logging
 from multiprocessing import freeze_support
 
-if "--pyside6" in sys.argv:
+# orjson is optional - fall back to the standard json module
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
+    _json_loads = json.loads
+
+USE_PYSIDE = "--pyside6" in sys.argv
+WT = "PySide6" if USE_PYSIDE else "PyQt6"
+
+if USE_PYSIDE:
     from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog
-    from PySide6.QtCore import QTimer, Qt, QCoreApplication, QEvent
-    from PySide6.QtGui import QIcon, QPixmap
-    from PySide6.QtUiTools import QUiLoader
+    from PySide6.QtCore import QTimer, Qt, QCoreApplication, QEvent, QDir
+    from PySide6.QtGui import QIcon, QPixmap, QImageWriter
+
+    # Generated from main_window_v2.ui via:
+    #   pyside6-uic main_window_v2.ui -o ui_main_window_v2.py
+    from ui_main_window_v2 import Ui_MainWindow
+
+    class MainWindowUi(QMainWindow, Ui_MainWindow):
+        """Main window built from the precompiled UI module"""
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self.setupUi(self)
 
 elif "--pyqt6" in sys.argv:
     from PyQt6.QtWidgets import QApplication, QMainWindow, QFileDialog
-    from PyQt6.QtCore import QTimer, Qt, QCoreApplication
-    from PyQt6.QtGui import QIcon
-    from PyQt6 import uic, QtWebEngineWidgets
+    from PyQt6.QtCore import QTimer, Qt, QCoreApplication, QDir
+    from PyQt6.QtGui import QIcon, QPixmap, QImageWriter
+    from PyQt6 import uic
 
 else:
     logging.error("must include --pyside6 or --pyqt6 in args!")
 
-from qt_material import apply_stylesheet, QtStyleTools, density
+import qt_material
+from qt_material import QtStyleTools, density
+
+# qt_material only registers its "qt_material:" resource prefix when a
+# stylesheet is built - register it up front so the logo icons below
+# resolve before the first apply_stylesheet() call
+QDir.addSearchPath(
+    "qt_material", os.path.join(os.path.dirname(qt_material.__file__), "resources")
+)
 
 if hasattr(Qt, "AA_ShareOpenGLContexts"):
     QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
@@ -29,7 +65,18 @@ else:
 app = QApplication(sys.argv)
 freeze_support()
 
-app.processEvents()
+# Logo icons shared by all windows
+LOGO = QIcon("qt_material:/logo/logo.svg")
+LOGO_FRAME = QIcon("qt_material:/logo/logo_frame.svg")
+# Toolbar logo pre-rendered at the toolbar icon size
+LOGO_TOOLBAR = QIcon(
+    QPixmap("qt_material:/logo/logo.svg").scaled(
+        24,
+        24,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+)
 
 # Extra stylesheets
 extra = {
@@ -49,77 +96,85 @@ extra = {
 ########################################################################
 class RuntimeStylesheets(QMainWindow, QtStyleTools):
     # ----------------------------------------------------------------------
-    def __init__(self):
+    def __init__(self, theme="default", invert=False):
         """Constructor"""
         super().__init__()
+        self._mdi_cache = (None, None)
+        self._last_saved_hash = None
 
-        if "--pyside6" in sys.argv:
-            self.main = QUiLoader().load("main_window_v2.ui", self)
+        if USE_PYSIDE:
+            self.main = MainWindowUi(self)
             self.main.installEventFilter(self)
-            wt = "PySide6"
-
-        elif "--pyqt6" in sys.argv:
+        else:
             self.main = uic.loadUi("main_window_v2.ui", self)
-            wt = "PyQt6"
 
-        self.main.setWindowTitle(f"{self.main.windowTitle()} - {wt}")
+        self.main.setWindowTitle(f"{self.main.windowTitle()} - {WT}")
 
         self.set_extra(extra)
         self.register_mdi_areas(self.main.mdiArea)
+        # The stylesheet must be applied before the theme dock is shown, because
+        # the dock reads the QTMATERIAL_* environment variables it sets. The
+        # method also styles the registered MDI areas.
+        self.apply_stylesheet(
+            app,
+            theme + ".xml",
+            invert_secondary=invert,
+            extra=extra,
+        )
         self.add_menu_density(self, self.main.menuDensity)
         self.add_menu_theme(self, self.main.menuStyles)
         self.show_dock_theme(self.main)
         self.custom_styles()
 
-        logo = QIcon("qt_material:/logo/logo.svg")
-        logo_frame = QIcon("qt_material:/logo/logo_frame.svg")
+        self.setWindowIcon(LOGO)
+        self.main.actionToolbar.setIcon(LOGO_TOOLBAR)
 
-        self.setWindowIcon(logo)
-        self.main.actionToolbar.setIcon(logo)
+        for lw in (self.main.listWidget_2, self.main.listWidget_3):
+            item = lw.item
+            for i in range(lw.count()):
+                item(i).setIcon(LOGO_FRAME)
 
-        for i in range(self.main.listWidget_2.count()):
-            self.main.listWidget_2.item(i).setIcon(logo_frame)
+        def open_file_dialog():
+            QFileDialog.getOpenFileName(self)
 
-        for i in range(self.main.listWidget_3.count()):
-            self.main.listWidget_3.item(i).setIcon(logo_frame)
+        def open_folder_dialog():
+            QFileDialog.getExistingDirectory(self)
 
-        self.main.pushButton_file_dialog.clicked.connect(
-            lambda: QFileDialog.getOpenFileName(self)
-        )
-        self.main.pushButton_folder_dialog.clicked.connect(
-            lambda: QFileDialog.getExistingDirectory(self)
-        )
+        self.main.pushButton_file_dialog.clicked.connect(open_file_dialog)
+        self.main.pushButton_folder_dialog.clicked.connect(open_folder_dialog)
 
-        self.main.action_widgets.triggered.connect(
-            lambda: (
-                self.main.stackedWidget.setCurrentIndex(0),
-                self.main.action_tabs.setChecked(False),
-                self.main.action_widgets.setChecked(True),
-                self.main.action_examples.setChecked(False),
-            )
-        )
+        sw = self.main.stackedWidget
+        aw = self.main.action_widgets
+        at = self.main.action_tabs
+        ae = self.main.action_examples
 
-        self.main.action_tabs.triggered.connect(
-            lambda: (
-                self.main.stackedWidget.setCurrentIndex(1),
-                self.main.action_widgets.setChecked(False),
-                self.main.action_tabs.setChecked(True),
-                self.main.action_examples.setChecked(False),
-            )
-        )
+        def show_widgets():
+            sw.setCurrentIndex(0)
+            at.setChecked(False)
+            aw.setChecked(True)
+            ae.setChecked(False)
 
-        self.main.action_examples.triggered.connect(
-            lambda: (
-                self.main.stackedWidget.setCurrentIndex(2),
-                self.main.action_widgets.setChecked(False),
-                self.main.action_tabs.setChecked(False),
-                self.main.action_examples.setChecked(True),
-                self.save_mdi_subwindow_positions(),
-            )
-        )
+        def show_tabs():
+            sw.setCurrentIndex(1)
+            aw.setChecked(False)
+            at.setChecked(True)
+            ae.setChecked(False)
+
+        def show_examples():
+            sw.setCurrentIndex(2)
+            aw.setChecked(False)
+            at.setChecked(False)
+            ae.setChecked(True)
+            self.save_mdi_subwindow_positions()
+
+        aw.triggered.connect(show_widgets)
+        at.triggered.connect(show_tabs)
+        ae.triggered.connect(show_examples)
 
         self.center_window()
-        self.load_mdi_subwindow_positions()
+        # Restore the MDI layout once the event loop runs so the disk I/O
+        # does not delay the first paint of the window
+        QTimer.singleShot(0, self.load_mdi_subwindow_positions)
         if len(sys.argv) > 2:
             self.main.stackedWidget.setCurrentIndex(2)
         else:
@@ -143,45 +198,62 @@ class RuntimeStylesheets(QMainWindow, QtStyleTools):
 
     # ----------------------------------------------------------------------
     def center_window(self):
+        screen = QApplication.primaryScreen().availableGeometry()
         self.main.resize(1925, 1175)
-        frame = self.frameGeometry()
-        center = QApplication.primaryScreen().availableGeometry().center()
-        frame.moveCenter(center)
-        self.move(frame.topLeft())
+        self.move(screen.center() - self.rect().center())
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def positions_hash(positions):
+        """Hash of {title: [x, y, width, height]} positions, independent of order"""
+        return hash(tuple(sorted((k, tuple(v)) for k, v in positions.items())))
 
     # ----------------------------------------------------------------------
     def save_mdi_subwindow_positions(self):
         """"""
-        positions = {}
-        for w in self.main.mdiArea.subWindowList():
-            title = w.windowTitle()
-            geom = w.geometry()
-            positions[title] = {
-                "x": geom.x(),
-                "y": geom.y(),
-                "width": geom.width(),
-                "height": geom.height(),
-            }
+        # getRect() returns (x, y, width, height) in a single call
+        positions = {
+            w.windowTitle(): w.geometry().getRect()
+            for w in self.main.mdiArea.subWindowList()
+        }
+        # Skip writing the file if nothing moved since the last save or load
+        h = self.positions_hash(positions)
+        if h == self._last_saved_hash:
+            return
+
         # Save positions to a JSON file
-        with open("mdi_positions.json", "w") as f:
-            json.dump(positions, f, indent=4)
+        with open("mdi_positions.json", "wb") as f:
+            f.write(_json_dumps(positions))
+        self._last_saved_hash = h
 
     # ----------------------------------------------------------------------
     def load_mdi_subwindow_positions(self):
         """"""
-        # Return empty positions if file does not exist
-        if not os.path.exists("mdi_positions.json"):
+        # Nothing to restore if the MDI area has no subwindows (anymore)
+        sub_windows = self.main.mdiArea.subWindowList()
+        if not sub_windows:
+            return {}
+
+        # Load positions from JSON file, reusing the parsed data if the
+        # file did not change since the last call. Return empty positions
+        # if the file does not exist.
+        try:
+            mtime = os.path.getmtime("mdi_positions.json")
+            if mtime == self._mdi_cache[0]:
+                positions = self._mdi_cache[1]
+            else:
+                with open("mdi_positions.json", "rb") as f:
+                    positions = _json_loads(f.read())
+                self._mdi_cache = (mtime, positions)
+                self._last_saved_hash = self.positions_hash(positions)
+        except FileNotFoundError:
             return {}
 
-        # Load positions from JSON file
-        with open("mdi_positions.json", "r") as f:
-            positions = json.load(f)
-        # Apply saved geometry to each MDI subwindow
-        for w in self.main.mdiArea.subWindowList():
-            title = w.windowTitle()
-            if title in positions:
-                pos = positions[title]
-                w.setGeometry(pos["x"], pos["y"], pos["width"], pos["height"])
+        # Apply saved geometry ([x, y, width, height]) to each MDI subwindow
+        for w in sub_windows:
+            g = positions.get(w.windowTitle())
+            if g:
+                w.setGeometry(*g)
         return positions
 
 
@@ -192,31 +264,23 @@ if __name__ == "__main__":
     # ----------------------------------------------------------------------
     def take_screenshot():
         pixmap = frame.main.grab()
-        pixmap.save(os.path.join("screenshots", f"{theme}.png"))
+        # Low zlib compression level - encoding dominates the screenshot time
+        writer = QImageWriter(os.path.join("screenshots", f"{theme}.png"), b"png")
+        writer.setCompression(1)
+        writer.write(pixmap.toImage())
         print(f"Saving {theme}")
 
     if len(sys.argv) > 2:
         theme = sys.argv[2]
+        os.makedirs("screenshots", exist_ok=True)
         QTimer.singleShot(T0, take_screenshot)
         QTimer.singleShot(T0 * 2, app.closeAllWindows)
     else:
         theme = "default"
 
-    apply_stylesheet(
-        app,
-        theme + ".xml",
-        invert_secondary=("light" in theme and "dark" not in theme),
-        extra=extra,
-    )
-
-    frame = RuntimeStylesheets()
+    invert = ("light" in theme) and ("dark" not in theme)
 
-    frame.apply_stylesheet(
-        app,
-        theme + ".xml",
-        invert_secondary=("light" in theme and "dark" not in theme),
-        extra=extra,
-    )
+    frame = RuntimeStylesheets(theme, invert)
 
     frame.main.show()
 
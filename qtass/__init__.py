@@ -1,16 +1,39 @@
-from typing import Optional, List, Dict, Any, Tuple, TypeVar, Union
+from typing import Optional, List, Dict, Set, Any, Tuple, TypeVar, Union, NamedTuple, Callable
 from enum import Enum, auto
 import os
+import re
 import json
+import xml.etree.ElementTree as ET
 from pathlib import Path
 import weakref
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
 import jinja2
-from dataclasses import dataclass
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+try:
+    from lxml import etree as lxml_etree
+    # Comments and processing instructions are dropped like ElementTree does
+    _LXML_THEME_PARSER = lxml_etree.XMLParser(
+        collect_ids=False,
+        remove_blank_text=True,
+        remove_comments=True,
+        remove_pis=True,
+        resolve_entities=False,
+    )
+    _XML_PARSE_ERRORS: Tuple[type, ...] = (ET.ParseError, lxml_etree.XMLSyntaxError)
+except ImportError:
+    lxml_etree = None
+    _XML_PARSE_ERRORS = (ET.ParseError,)
 from PySide6.QtGui import (
     QIconEngine,
     QPixmap,
     QPainter,
-    QImage,
     QIcon,
     QPalette,
     QColor,
@@ -23,18 +46,27 @@ from PySide6.QtCore import (
     QSize,
     Qt,
     QFileInfo,
-    QXmlStreamReader,
     QObject,
     QDir,
     QFile,
     QIODevice,
+    QThreadPool,
 )
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Signal, Slot
+from PySide6.QtCore import Signal, Slot, SIGNAL
 from PySide6.QtSvg import QSvgRenderer
 
 
 tColorReplaceList = List[Tuple[str, str]]
+# Pre-encoded color replace list: (alternation pattern or None, template -> theme color)
+tCompiledColorReplaceList = Tuple[Optional["re.Pattern[bytes]"], Dict[bytes, bytes]]
+# Resource generation job: (resource group name, output folder, compiled color replace list)
+tResourceJob = Tuple[str, Path, tCompiledColorReplaceList]
+
+# Start delimiters of Jinja2 variables, statements and comments
+_JINJA2_MARKERS = ("{{", "{%", "{#")
+# Line breaks recognized by the Jinja2 lexer
+_JINJA2_NEWLINE_RE = re.compile(r"\r\n|\r|\n")
 
 
 class SvgIconEngine(QIconEngine):
@@ -43,7 +75,13 @@ class SvgIconEngine(QIconEngine):
     and updating their colors using an advanced stylesheet.
     """
 
-    _instances: weakref.WeakSet["SvgIconEngine"] = weakref.WeakSet()
+    # Weak references to all live engines and the number of dead references
+    # in the list, used to decide when to compact it
+    _instance_refs: List["weakref.ref[SvgIconEngine]"] = []
+    _dead_ref_count: int = 0
+
+    # Maximum number of rasterized pixmaps kept per icon engine
+    _pixmap_cache_limit: int = 64
 
     def __init__(
         self,
@@ -61,35 +99,51 @@ class SvgIconEngine(QIconEngine):
         super().__init__()
         self._svg_template: QByteArray = QByteArray(svg_content)
         self._svg_content: QByteArray = QByteArray()
+        self._renderer: Optional[QSvgRenderer] = None
+        # LRU cache of rendered pixmaps keyed by (width, height, mode, state)
+        self._pixmap_cache: OrderedDict[
+            Tuple[int, int, QIcon.Mode, QIcon.State], QPixmap
+        ] = OrderedDict()
         self._advanced_stylesheet = advanced_stylesheet
 
         self.update()
-        SvgIconEngine._instances.add(self)
+        SvgIconEngine._instance_refs.append(weakref.ref(self, SvgIconEngine._on_instance_deleted))
 
-    def __del__(self):
+    @staticmethod
+    def _on_instance_deleted(ref: "weakref.ref[SvgIconEngine]") -> None:
         """
-        Ensure the instance is removed from the global tracking set on deletion.
-        Note: Python garbage collection may delay this or skip it entirely.
+        Weak reference callback - counts dead references and compacts the
+        instance list once at least half of its entries are dead.
         """
-        SvgIconEngine._instances.discard(self)
+        SvgIconEngine._dead_ref_count += 1
+        if SvgIconEngine._dead_ref_count * 2 >= len(SvgIconEngine._instance_refs):
+            SvgIconEngine._instance_refs = [
+                r for r in SvgIconEngine._instance_refs if r() is not None
+            ]
+            SvgIconEngine._dead_ref_count = 0
 
     def update(self) -> None:
         """
-        Update the SVG content buffer by applying the current theme's icon colors.
+        Update the SVG content buffer by applying the current theme's icon colors
+        and rebuild the cached SVG renderer. Cached pixmaps are discarded.
         """
+        self._pixmap_cache.clear()
         self._svg_content = QByteArray(self._svg_template)
         if self._advanced_stylesheet and hasattr(
             self._advanced_stylesheet, "replace_svg_colors"
         ):
             self._advanced_stylesheet.replace_svg_colors(self._svg_content)
+        self._renderer = QSvgRenderer(self._svg_content)
 
     @staticmethod
     def update_all_icons() -> None:
         """
         Update all icon engine instances by reapplying the theme-based transformations.
         """
-        for engine in list(SvgIconEngine._instances):
-            engine.update()
+        for ref in SvgIconEngine._instance_refs:
+            engine = ref()
+            if engine is not None:
+                engine.update()
 
     def paint(
         self, painter: QPainter, rect: QRect, mode: QIcon.Mode, state: QIcon.State
@@ -103,7 +157,10 @@ class SvgIconEngine(QIconEngine):
             mode (QIcon.Mode): The icon display mode (not used).
             state (QIcon.State): The icon state (not used).
         """
-        renderer = QSvgRenderer(self._svg_content)
+        renderer = self._renderer
+        # Invalid SVG content cannot be rendered - update() rebuilds the renderer
+        if renderer is None or not renderer.isValid():
+            return
         renderer.render(painter, rect)
 
     def clone(self) -> QIconEngine:
@@ -126,22 +183,31 @@ class SvgIconEngine(QIconEngine):
 
         Returns:
             QPixmap: A transparent pixmap with the SVG content rendered into it.
+                     Pixmaps are cached per size, mode and state.
         """
-        image = QImage(size, QImage.Format_ARGB32)
-        image.fill(Qt.transparent)
-        pixmap = QPixmap.fromImage(image, Qt.NoFormatConversion)
+        key = (size.width(), size.height(), mode, state)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is not None:
+            self._pixmap_cache.move_to_end(key)
+            return pixmap
+
+        pixmap = QPixmap(size)
+        pixmap.fill(Qt.transparent)
 
         painter = QPainter(pixmap)
         self.paint(painter, QRect(0, 0, size.width(), size.height()), mode, state)
         painter.end()
 
+        self._pixmap_cache[key] = pixmap
+        if len(self._pixmap_cache) > self._pixmap_cache_limit:
+            self._pixmap_cache.popitem(last=False)
         return pixmap
 
 
-@dataclass
-class PaletteColorEntry:
+class PaletteColorEntry(NamedTuple):
     """
     Represents a parsed palette color entry including its group, role, and associated color variable.
+    Entries are immutable tuples, so they can be unpacked as (group, role, color_variable).
     """
 
     group: QPalette.ColorGroup = QPalette.ColorGroup.Active
@@ -158,6 +224,33 @@ class PaletteColorEntry:
 
 
 
+_COLOR_ROLE_MAP: Dict[str, QPalette.ColorRole] = {
+    "WindowText": QPalette.ColorRole.WindowText,
+    "Button": QPalette.ColorRole.Button,
+    "Light": QPalette.ColorRole.Light,
+    "Midlight": QPalette.ColorRole.Midlight,
+    "Dark": QPalette.ColorRole.Dark,
+    "Mid": QPalette.ColorRole.Mid,
+    "Text": QPalette.ColorRole.Text,
+    "BrightText": QPalette.ColorRole.BrightText,
+    "ButtonText": QPalette.ColorRole.ButtonText,
+    "Base": QPalette.ColorRole.Base,
+    "Window": QPalette.ColorRole.Window,
+    "Shadow": QPalette.ColorRole.Shadow,
+    "Highlight": QPalette.ColorRole.Highlight,
+    "HighlightedText": QPalette.ColorRole.HighlightedText,
+    "Link": QPalette.ColorRole.Link,
+    "LinkVisited": QPalette.ColorRole.LinkVisited,
+    "AlternateBase": QPalette.ColorRole.AlternateBase,
+    "ToolTipBase": QPalette.ColorRole.ToolTipBase,
+    "ToolTipText": QPalette.ColorRole.ToolTipText,
+    "NoRole": QPalette.ColorRole.NoRole,
+}
+# Add Qt 5.12+ role if available
+if hasattr(QPalette.ColorRole, "PlaceholderText"):
+    _COLOR_ROLE_MAP["PlaceholderText"] = QPalette.ColorRole.PlaceholderText
+
+
 def color_role_from_string(text: str) -> QPalette.ColorRole:
     """
     Converts a string name to a QPalette.ColorRole enum.
@@ -168,32 +261,7 @@ def color_role_from_string(text: str) -> QPalette.ColorRole:
     Returns:
         QPalette.ColorRole: Corresponding enum or QPalette.NoRole if not matched.
     """
-    color_role_map: Dict[str, QPalette.ColorRole] = {
-        "WindowText": QPalette.ColorRole.WindowText,
-        "Button": QPalette.ColorRole.Button,
-        "Light": QPalette.ColorRole.Light,
-        "Midlight": QPalette.ColorRole.Midlight,
-        "Dark": QPalette.ColorRole.Dark,
-        "Mid": QPalette.ColorRole.Mid,
-        "Text": QPalette.ColorRole.Text,
-        "BrightText": QPalette.ColorRole.BrightText,
-        "ButtonText": QPalette.ColorRole.ButtonText,
-        "Base": QPalette.ColorRole.Base,
-        "Window": QPalette.ColorRole.Window,
-        "Shadow": QPalette.ColorRole.Shadow,
-        "Highlight": QPalette.ColorRole.Highlight,
-        "HighlightedText": QPalette.ColorRole.HighlightedText,
-        "Link": QPalette.ColorRole.Link,
-        "LinkVisited": QPalette.ColorRole.LinkVisited,
-        "AlternateBase": QPalette.ColorRole.AlternateBase,
-        "ToolTipBase": QPalette.ColorRole.ToolTipBase,
-        "ToolTipText": QPalette.ColorRole.ToolTipText,
-        "NoRole": QPalette.ColorRole.NoRole,
-    }
-    # Add Qt 5.12+ role if available
-    if hasattr(QPalette.ColorRole, "PlaceholderText"):
-        color_role_map["PlaceholderText"] = QPalette.ColorRole.PlaceholderText
-    return color_role_map.get(text, QPalette.ColorRole.NoRole)
+    return _COLOR_ROLE_MAP.get(text, QPalette.ColorRole.NoRole)
 
 
 
@@ -211,6 +279,13 @@ def insert_into_map(target_map: Dict[K, V], source_map: Dict[K, V]) -> None:
     target_map.update(source_map)
 
 
+_COLOR_GROUP_NAMES: Dict[QPalette.ColorGroup, str] = {
+    QPalette.ColorGroup.Active: "active",
+    QPalette.ColorGroup.Disabled: "disabled",
+    QPalette.ColorGroup.Inactive: "inactive",
+}
+
+
 def color_group_string(color_group: QPalette.ColorGroup) -> str:
     """
     Converts a QPalette.ColorGroup enum to its corresponding lowercase string.
@@ -221,12 +296,7 @@ def color_group_string(color_group: QPalette.ColorGroup) -> str:
     Returns:
         str: The string representation (e.g. "active", "disabled", or "inactive").
     """
-    mapping = {
-        QPalette.ColorGroup.Active: "active",
-        QPalette.ColorGroup.Disabled: "disabled",
-        QPalette.ColorGroup.Inactive: "inactive",
-    }
-    return mapping.get(color_group, "")
+    return _COLOR_GROUP_NAMES.get(color_group, "")
 
 
 class QtAdvancedStylesheetError(Exception):
@@ -254,9 +324,11 @@ class ResourceGeneratorError(QtAdvancedStylesheetError):
     pass
 
 
+@functools.lru_cache(maxsize=512)
 def jinja2_filter_opacity(theme, value=0.5):
     """
     Converts a hex color string from a theme into an RGBA color string with the specified opacity.
+    Results are cached because templates reuse the same few color / opacity pairs.
     Args:
         theme (str): A hex color string (e.g., "#RRGGBB").
         value (float, optional): The opacity value for the RGBA color (default is 0.5).
@@ -266,10 +338,7 @@ def jinja2_filter_opacity(theme, value=0.5):
         >>> jinja2_filter_opacity("#FFAA33", 0.8)
         'rgba(255, 170, 51, 0.8)'
     """
-    r, g, b = theme[1:][0:2], theme[1:][2:4], theme[1:][4:]
-    r, g, b = int(r, 16), int(g, 16), int(b, 16)
-
-    return f"rgba({r}, {g}, {b}, {value})"
+    return f"rgba({int(theme[1:3], 16)}, {int(theme[3:5], 16)}, {int(theme[5:], 16)}, {value})"
 
 
 def jinja2_filter_density(value, density_scale, border=0, scale=1, density_interval=4, min_=4):
@@ -306,11 +375,72 @@ def jinja2_filter_density(value, density_scale, border=0, scale=1, density_inter
     return density
 
 
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Writes data to a temporary file next to path and renames it to path when
+    complete, so that readers never see a partly written file.
+    Args:
+        path (Path): The path of the file to write.
+        data (bytes): The file content.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_color_replace_list(
+    color_replace_list: Tuple[Tuple[str, str], ...]
+) -> "tCompiledColorReplaceList":
+    """
+    Compiles and caches a color replace list. Template colors are matched
+    case-insensitively, because "#FFFFFF" and "#ffffff" denote the same color.
+    Args:
+        color_replace_list (Tuple[Tuple[str, str], ...]): The (template color, theme color) pairs.
+    Returns:
+        tCompiledColorReplaceList: The alternation pattern and the lower case lookup table.
+    """
+    table = {
+        template_color.encode("latin1").lower(): theme_color.encode("latin1")
+        for template_color, theme_color in color_replace_list
+    }
+    if not table:
+        return None, table
+    # Prefer the longest template color if one is a prefix of another
+    keys = sorted(table, key=len, reverse=True)
+    return re.compile(b"|".join(re.escape(k) for k in keys), re.IGNORECASE), table
+
+
 class QtAdvancedStylesheet(QObject):
     """
     Encapsulates all information about a single stylesheet-based style.
     """
 
+    # Parsed theme files keyed by (path, mtime): (dark theme flag, color variables,
+    # color variables converted to QColor), least recently used first
+    _theme_file_cache: OrderedDict[
+        Tuple[str, float], Tuple[bool, Dict[str, str], Dict[str, QColor]]
+    ] = OrderedDict()
+    # Maximum number of parsed theme files kept
+    _theme_file_cache_limit: int = 32
+    # Font folders and icon search paths already registered with Qt. Both
+    # registrations are application wide, so they are tracked per class.
+    _registered_font_dirs: Set[str] = set()
+    _registered_icon_search_paths: Set[str] = set()
+    # Application font ids keyed by font file path
+    _font_ids: Dict[str, int] = {}
+
+    # Maximum number of generated stylesheets kept per instance
+    _stylesheet_cache_limit: int = 8
+    # Stylesheet cache key of the content last written to each CSS output file.
+    # All themes of a style export to the same file, so a cached stylesheet may
+    # differ from the one on disk.
+    _written_stylesheet_keys: Dict[str, Tuple[str, float, frozenset]] = {}
+
     class Location(Enum):
         """
         An enumeration representing various resource locations within the application.
@@ -333,21 +463,53 @@ class QtAdvancedStylesheet(QObject):
     # Signal emitted when the stylesheet changes due to style, theme, or variable update
     stylesheet_changed = Signal()
 
+    # Signal emitted when an asynchronous stylesheet update fails
+    stylesheet_update_failed = Signal(str)
+
+    # Internal signals to hand the results of the asynchronous update from
+    # the worker thread back to the thread of this object
+    _async_update_finished = Signal(int, str)
+    _async_update_failed = Signal(int, str)
+
+    # Signatures for checking if a signal has receivers before emitting it
+    _CURRENT_STYLE_CHANGED_SIGNATURE = SIGNAL("current_style_changed(QString)")
+    _CURRENT_THEME_CHANGED_SIGNATURE = SIGNAL("current_theme_changed(QString)")
+    _STYLESHEET_CHANGED_SIGNATURE = SIGNAL("stylesheet_changed()")
+
     def __init__(self, parent: QObject | None = None):
         super().__init__(parent)
-        self.styles_dir: Path = Path(__file__).parent / "styles"
-        self.output_dir: str = ""
+        # Cached paths derived from styles_dir, output_dir and current_style
+        self._current_style_path_cache: Optional[Path] = None
+        self._output_path_cache: Optional[Path] = None
+        self._location_path_cache: Dict["QtAdvancedStylesheet.Location", Path] = {}
+        self._styles_dir: Path = Path(__file__).parent / "styles"
+        self._output_dir: str = ""
+        self._current_style: str = ""
         self.style_variables: Dict[str, str] = {}
         self.theme_color_variables: Dict[str, str] = {}
-        self.theme_variables: Dict[str, str] = {}  # theme variables = style_variables + theme_colors
+        self._theme_variable_overrides: Dict[str, str] = {}  # non-color values set via set_theme_variable_value
+        self._color_map: Dict[str, QColor] = {}  # theme color variables as QColor, built at theme load
+        # Theme palettes keyed by (style, theme, theme file key). Palettes built from colors
+        # changed by set_theme_variable_value are not cached.
+        self._palette_cache: Dict[Tuple[str, str, Optional[Tuple[str, float]]], QPalette] = {}
+        # Cache key (path, mtime) of the currently parsed theme file
+        self._theme_file_key: Optional[Tuple[str, float]] = None
+        self._theme_colors_modified: bool = False
         self.stylesheet: str = ""
-        self.current_style: str = ""
         self._current_theme: str = ""
         self.default_theme: str = ""
         self.style_name: str = ""
         self.icon_file: str = ""
         self.resource_replace_list: List[Tuple[str, str]] = []
         self.palette_colors: List["PaletteColorEntry"] = []
+        # Parallel tuples of the palette_colors fields iterated by generate_theme_palette
+        self._palette_groups: Tuple[QPalette.ColorGroup, ...] = ()
+        self._palette_roles: Tuple[QPalette.ColorRole, ...] = ()
+        self._palette_variables: Tuple[str, ...] = ()
+        # Palette entries resolved against the current theme colors, only valid colors
+        self._valid_palette_entries: Tuple[
+            Tuple[QPalette.ColorGroup, QPalette.ColorRole, QColor], ...
+        ] = ()
         self.palette_base_color: str = ""
         self.json_style_param: Dict[str, Any] = {}
         self.icon: QIcon = QIcon()
@@ -355,12 +517,50 @@ class QtAdvancedStylesheet(QObject):
         self.themes: list[str] = []
         self.is_dark_theme: bool = False
         self._icon_color_replace_list: "tColorReplaceList" = list()
-
-
-    def __generate_stylesheet(self) -> None:
+        self._icon_color_replace_table: Optional["tCompiledColorReplaceList"] = None
+        # Theme aware icons keyed by SVG filename. The icon engines recolor
+        # themselves on every stylesheet update, so the icons stay valid.
+        self._theme_aware_icon_cache: Dict[str, QIcon] = {}
+        # LRU cache of generated stylesheets keyed by (template path, template mtime, theme variables)
+        self._stylesheet_cache: OrderedDict[Tuple[str, float, frozenset], str] = OrderedDict()
+        # Jinja2 environments are kept alive so compiled templates get reused
+        self._jinja2_file_environments: Dict[str, jinja2.Environment] = {}
+        self._jinja2_string_loader = jinja2.DictLoader({})
+        self._jinja2_string_environment = self.__create_jinja2_environment(
+            self._jinja2_string_loader
+        )
+        # Serial number of the latest asynchronous stylesheet update. Results of
+        # older updates are dropped.
+        self._async_update_serial: int = 0
+        # Serializes writing the resources and the stylesheet file, so that an
+        # asynchronous update never writes concurrently with another update
+        self._output_lock = threading.Lock()
+        self._pending_stylesheet_cache_key: Optional[Tuple[str, float, frozenset]] = None
+        self._async_update_finished.connect(self.__on_async_update_finished)
+        self._async_update_failed.connect(self.__on_async_update_failed)
+        # Set if the current style needs to be reloaded by set_current_style
+        # because a path setting changed since it was loaded
+        self._style_dir_dirty: bool = True
+        # Path and modification times of the style files when the style was loaded
+        self._style_json_file: str = ""
+        self._style_files_mtime: Optional[Tuple[float, float, float]] = None
+        # The QApplication instance, once one exists
+        self._app: Optional[QApplication] = None
+        # Incremented whenever a style JSON file is parsed
+        self._style_generation: int = 0
+        # Inputs of the last successful update_stylesheet call
+        self._last_stylesheet_fingerprint: Optional[Tuple[Any, ...]] = None
+
+
+    def __stylesheet_job(
+        self,
+    ) -> Tuple[Tuple[str, float, frozenset], jinja2.Environment, str, Path]:
         """
-        Generate the final stylesheet from the stylesheet template file.
-        Returns True on success, False otherwise.
+        Collect everything required to render the stylesheet template file.
+
+        Returns:
+            Tuple: The stylesheet cache key, the Jinja2 environment, the template
+                   name and the path of the CSS output file.
         """
         css_template_file_name = self.json_style_param.get("css_template", "")
         if not css_template_file_name:
@@ -369,135 +569,262 @@ class QtAdvancedStylesheet(QObject):
         template_file_path = os.path.join(
             self.current_style_path(), css_template_file_name
         )
-        if not os.path.exists(template_file_path):
+        try:
+            template_mtime = os.path.getmtime(template_file_path)
+        except OSError as e:
             raise CssTemplateError(
                 f"Stylesheet folder does not contain the CSS template file {css_template_file_name}"
-            )
+            ) from e
 
-        parent, template = os.path.split(template_file_path)
-        loader = jinja2.FileSystemLoader(parent)
-        self.stylesheet = self.__render_stylesheet_template(template, loader)
         css_output_name = (
             os.path.splitext(os.path.basename(template_file_path))[0] + ".css"
         )
-        self.__export_internal_stylesheet(css_output_name)
-        return
+        cache_key = (
+            template_file_path,
+            template_mtime,
+            frozenset(self.theme_variables.items()),
+        )
+
+        parent, template = os.path.split(template_file_path)
+        env = self._jinja2_file_environments.get(parent)
+        if env is None:
+            env = self.__create_jinja2_environment(jinja2.FileSystemLoader(parent))
+            self._jinja2_file_environments[parent] = env
+        return cache_key, env, template, self.current_style_output_path() / css_output_name
 
-    def __render_stylesheet_template(self, template_name: str, loader : jinja2.BaseLoader) -> str:
+
+    def __generate_stylesheet(self) -> None:
         """
-        Renders a stylesheet template using Jinja2 with custom filters and theme variables.
+        Generate the final stylesheet from the stylesheet template file.
+        """
+        cache_key, env, template, output_filename = self.__stylesheet_job()
+
+        with self._output_lock:
+            # Reuse the stylesheet if the same template was already rendered with
+            # the same set of theme variables
+            stylesheet = self.__cached_stylesheet(cache_key)
+            if stylesheet is not None:
+                self.stylesheet = stylesheet
+                self.__export_stylesheet(stylesheet, cache_key, output_filename)
+                return
+
+            self.stylesheet = self.__render_stylesheet_template(template, env)
+            self.__export_stylesheet(self.stylesheet, cache_key, output_filename)
+            self.__cache_stylesheet(cache_key, self.stylesheet)
+
+
+    def __export_stylesheet(
+        self, stylesheet: str, cache_key: Tuple[str, float, frozenset], output_filename: Path
+    ) -> None:
+        """
+        Write the stylesheet to output_filename unless the file already holds
+        the stylesheet generated for cache_key.
+        """
+        path = str(output_filename)
+        if self._written_stylesheet_keys.get(path) == cache_key and output_filename.exists():
+            return
+        self.__write_stylesheet(stylesheet, output_filename)
+        self._written_stylesheet_keys[path] = cache_key
+
+
+    def __cached_stylesheet(self, cache_key: Tuple[str, float, frozenset]) -> Optional[str]:
+        """
+        Get a generated stylesheet from the stylesheet cache.
+
+        Returns:
+            Optional[str]: The stylesheet, or None if it is not cached.
+        """
+        stylesheet = self._stylesheet_cache.get(cache_key)
+        if stylesheet is not None:
+            self._stylesheet_cache.move_to_end(cache_key)
+        return stylesheet
+
+
+    def __cache_stylesheet(self, cache_key: Tuple[str, float, frozenset], stylesheet: str) -> None:
+        """
+        Store a generated stylesheet in the stylesheet cache, and drop the
+        least recently used one if the cache is full.
+        """
+        self._stylesheet_cache[cache_key] = stylesheet
+        self._stylesheet_cache.move_to_end(cache_key)
+        if len(self._stylesheet_cache) > self._stylesheet_cache_limit:
+            self._stylesheet_cache.popitem(last=False)
+
+    @staticmethod
+    def __create_jinja2_environment(loader: jinja2.BaseLoader) -> jinja2.Environment:
+        """
+        Creates a Jinja2 environment with the custom stylesheet filters.
 
         Args:
-            template (str): The name of the Jinja2 template file to render.
             loader (jinja2.BaseLoader): The Jinja2 template loader instance.
 
-        Side Effects:
-            Sets the rendered stylesheet to the `self.stylesheet` attribute.
-
         Filters:
             - "opacity": Uses the `jinja2_filter_opacity` function.
             - "density": Uses the `jinja2_filter_density` function.
-
         """
         env = jinja2.Environment(autoescape=False, loader=loader)
         env.filters["opacity"] = jinja2_filter_opacity
         env.filters["density"] = jinja2_filter_density
-        template = env.get_template(template_name)
-        return template.render(self.theme_variables)
-    
+        return env
 
-    def __export_internal_stylesheet(self, filename: str) -> None:
+    def __render_stylesheet_template(
+        self,
+        template_name: str,
+        env: jinja2.Environment,
+        variables: Optional[Dict[str, str]] = None,
+    ) -> str:
         """
-        Export the internal generated stylesheet to a file.
+        Renders a stylesheet template using Jinja2 with custom filters and theme variables.
 
         Args:
-            filename (str): The output filename.
+            template_name (str): The name of the Jinja2 template to render.
+            env (jinja2.Environment): The environment that loads and caches the template.
+            variables (Optional[Dict[str, str]]): The variables to render with. If None,
+                the current theme variables are used.
 
         Returns:
-            bool: Success status.
+            str: The rendered stylesheet.
         """
-        return self.__store_stylesheet(self.stylesheet, filename)
-
+        if variables is None:
+            variables = self.theme_variables
+        template = env.get_template(template_name)
+        return template.render(variables)
+    
 
     def __store_stylesheet(self, stylesheet: str, filename: str) -> None:
         """
         Store the given stylesheet content to the specified filename.
         """
-        output_path = self.current_style_output_path()
-        Path(output_path).mkdir(parents=True, exist_ok=True)
-        output_filename = output_path / filename
+        self.__write_stylesheet(stylesheet, self.current_style_output_path() / filename)
 
-        output_file = QFile(output_filename)
-        if not output_file.open(QIODevice.OpenModeFlag.WriteOnly):
-            raise CssExportError(
-                f"Exporting stylesheet {filename} caused error: {output_file.errorString()}"
-            )
 
+    @staticmethod
+    def __write_stylesheet(stylesheet: str, output_filename: Path) -> None:
+        """
+        Write the given stylesheet content as UTF-8 to output_filename.
+        The parent folder is created if required.
+        """
         # Write the stylesheet as UTF-8 bytes
-        output_file.write(QByteArray(bytes(stylesheet, "utf-8")))
-        output_file.close()
+        try:
+            output_filename.parent.mkdir(parents=True, exist_ok=True)
+            _write_bytes_atomic(output_filename, stylesheet.encode("utf-8"))
+        except OSError as e:
+            raise CssExportError(
+                f"Exporting stylesheet {output_filename.name} caused error: {e.strerror or e}"
+            ) from e
 
 
     def __parse_variables_from_xml(
-        self, reader: QXmlStreamReader, tag_name: str, variables: Dict[str, str]
+        self, parent: ET.Element, tag_name: str, variables: Dict[str, str]
     ) -> None:
         """
-        Parse a list of theme variables from an XML stream.
+        Parse a list of theme variables from the child elements of an XML element.
         """
-        while reader.readNextStartElement():
-            current_name = reader.name()
-            if current_name != tag_name:
+        for element in parent:
+            if element.tag != tag_name:
                 raise ThemeXmlError(
-                    f"Malformed theme file - expected tag <{tag_name}> instead of <{current_name}>"
+                    f"Malformed theme file - expected tag <{tag_name}> instead of <{element.tag}>"
                 )
 
-            name = reader.attributes().value("name")
+            name = element.get("name")
             if not name:
                 raise ThemeXmlError(
                     f"Malformed theme file - 'name' attribute missing in <{tag_name}> tag"
                 )
-            name_str = name  # PySide6 returns QString or str depending on binding
 
-            value = reader.readElementText(QXmlStreamReader.ReadElementTextBehaviour.SkipChildElements)
+            value = element.text
             if not value:
                 raise ThemeXmlError(
                     f"Malformed theme file - text of <{tag_name}> tag is empty"
                 )
 
-            variables[name_str] = value
+            variables[name] = value
 
 
-    def __parse_theme_file(self, theme_filename: str) -> None:
+    def __parse_theme_file(self, theme_filename: str) -> bool:
         """
-        Parse the theme file given by filename.
+        Parse the theme file given by filename. Parsed theme files are cached
+        until the file is modified.
+
+        Returns:
+            bool: True if the theme file was parsed successfully.
         """
         theme_file_name = (
             self.path(QtAdvancedStylesheet.Location.THEMES_LOCATION) / theme_filename
         )
-        theme_file = QFile(theme_file_name)
-        if not theme_file.open(QIODevice.ReadOnly):
-            raise ThemeXmlError(f"Cannot open theme file: {theme_file_name}")
+        try:
+            cache_key = (str(theme_file_name), os.path.getmtime(theme_file_name))
+        except OSError as e:
+            raise ThemeXmlError(f"Cannot open theme file: {theme_file_name}") from e
+
+        cached = self._theme_file_cache.get(cache_key)
+        if cached is None:
+            cached = self.__read_theme_file(theme_file_name)
+            self._theme_file_cache[cache_key] = cached
+            if len(self._theme_file_cache) > self._theme_file_cache_limit:
+                self._theme_file_cache.popitem(last=False)
+            # The theme file is new or was modified
+            self._palette_cache.clear()
+        else:
+            self._theme_file_cache.move_to_end(cache_key)
+        # Palettes are keyed by the theme file key too, because another instance
+        # may have re-read a modified theme file into the shared cache
+        self._theme_file_key = cache_key
+
+        self.is_dark_theme, color_variables, color_map = cached
+        self._theme_variable_overrides = {}
+        self.theme_color_variables = dict(color_variables)
+        self._theme_colors_modified = False
+        # The cached QColors are never modified in place, so a shallow copy is enough
+        self._color_map = dict(color_map)
+        self.__resolve_palette_entries()
+        self._icon_color_replace_list.clear()
+        self._icon_color_replace_table = None
+        return True
 
-        xml_reader = QXmlStreamReader(theme_file)
-        xml_reader.readNextStartElement()
-        if xml_reader.name() != "resources":
+
+    def __read_theme_file(
+        self, theme_file_name: Path
+    ) -> Tuple[bool, Dict[str, str], Dict[str, QColor]]:
+        """
+        Read and parse a theme XML file.
+
+        Args:
+            theme_file_name (Path): The path of the theme file.
+
+        Returns:
+            Tuple[bool, Dict[str, str], Dict[str, QColor]]: The dark theme flag,
+                the color variables and the color variables converted to QColor.
+        """
+        try:
+            data = theme_file_name.read_bytes()
+        except OSError as e:
+            raise ThemeXmlError(f"Cannot open theme file: {theme_file_name}") from e
+
+        try:
+            if lxml_etree is not None:
+                root = lxml_etree.fromstring(data, _LXML_THEME_PARSER)
+            else:
+                root = ET.fromstring(data)
+        except _XML_PARSE_ERRORS as e:
+            raise ThemeXmlError(f"Malformed theme file {theme_file_name}: {e}") from e
+
+        if root.tag != "resources":
             raise ThemeXmlError(
-                f"Malformed theme file - expected tag <resources> instead of <{xml_reader.name()}>"
+                f"Malformed theme file - expected tag <resources> instead of <{root.tag}>"
             )
 
-        dark_attr = xml_reader.attributes().value("dark")
+        dark_attr = root.get("dark")
         if not dark_attr:
             # Fallback: check if filename starts with 'dark' (case-insensitive)
-            self.is_dark_theme = theme_filename.lower().startswith("dark")
+            is_dark_theme = theme_file_name.name.lower().startswith("dark")
         else:
-            self.is_dark_theme = int(dark_attr) == 1
+            is_dark_theme = int(dark_attr) == 1
 
         color_variables: Dict[str, str] = {}
-        self.__parse_variables_from_xml(xml_reader, "color", color_variables)
-        self.theme_variables = self.style_variables.copy()
-        self.theme_variables.update(color_variables)
-        self.theme_color_variables = color_variables
-        return
+        self.__parse_variables_from_xml(root, "color", color_variables)
+        color_map = {k: QColor(v) for k, v in color_variables.items()}
+        return is_dark_theme, color_variables, color_map
 
 
     def __parse_style_json_file(self) -> None:
@@ -514,12 +841,16 @@ class QtAdvancedStylesheet(QObject):
             raise StyleJsonError("Stylesheet folder contains multiple theme JSON files")
 
         try:
-            with open(json_files[0], 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+            json_file = str(json_files[0])
+            self._style_json_file = json_file
+            # orjson (if installed) and json both accept the undecoded file content
+            json_data = _json_loads(Path(json_file).read_bytes())
         except Exception as e:
             raise StyleJsonError(f"Loading style JSON file caused error: {str(e)}") from e
 
         self.json_style_param = json_data
+        self._style_generation += 1
+        self._palette_cache.clear()
         self.style_name = json_data.get("name", "")
         if not self.style_name:
             raise StyleJsonError('No key "name" found in style JSON file')
@@ -539,82 +870,213 @@ class QtAdvancedStylesheet(QObject):
             raise StyleJsonError('No key "default_theme" found in style JSON file')
 
 
-    def __add_fonts(self, fonts_dir: Optional["QDir"] = None) -> None:
+    def __add_fonts(self, fonts_dir: Optional[str] = None) -> None:
         """
         Register style fonts to the font database.
 
         Args:
-            directory (Optional[QDir]): Directory containing fonts. If None, defaults used.
+            fonts_dir (Optional[str]): Directory containing fonts. If None, the
+                                       fonts folder of the current style is used.
         """
         # Return early if no widgets are present, to avoid potential crashes
-        app = QApplication.instance()
-        if app is None or not isinstance(app, QApplication) or not app.allWidgets():
+        app = self.__application()
+        if app is None or not app.allWidgets():
             return
 
-        if dir is None:
-            fonts_dir = QDir(self.path(QtAdvancedStylesheet.Location.FONTS_LOCATION))
-            self.__add_fonts(fonts_dir)
-        else:
-            # Recursively add fonts from subdirectories
-            for folder in dir.entryList(QDir.Filter.Dirs | QDir.Filter.NoDotAndDotDot):
-                if dir.cd(folder):
-                    self.__add_fonts(dir)
-                    dir.cdUp()
+        if fonts_dir is None:
+            fonts_dir = str(self.path(QtAdvancedStylesheet.Location.FONTS_LOCATION))
+        if fonts_dir in self._registered_font_dirs:
+            return
+        self._registered_font_dirs.add(fonts_dir)
+
+        # Add all .ttf font files from this directory and its subdirectories
+        # that are not registered yet
+        font_files = [
+            os.path.join(dirpath, font_file)
+            for dirpath, _, files in os.walk(fonts_dir)
+            for font_file in files
+            if font_file.endswith(".ttf")
+        ]
+        font_ids = self._font_ids
+        for font_file in font_files:
+            if font_file in font_ids:
+                continue
+            font_id = QFontDatabase.addApplicationFont(font_file)
+            if font_id != -1:
+                font_ids[font_file] = font_id
+
+
+    @staticmethod
+    def __generate_resource_file(
+        svg_file: str,
+        output_dir: Path,
+        color_replace_table: "tCompiledColorReplaceList",
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """
+        Write a recolored copy of a single SVG file into output_dir. Nothing is
+        written if is_cancelled returns True.
+
+        Raises:
+            ResourceGenerationError: If reading the SVG or writing the output fails.
+        """
+        if is_cancelled is not None and is_cancelled():
+            return
+        svg_path = Path(svg_file)
+        try:
+            content = svg_path.read_bytes()
+        except OSError as e:
+            raise ResourceGeneratorError(f"Failed to open SVG file: {svg_path.name}") from e
+
+        content = QtAdvancedStylesheet.__replace_colors_in_bytes(content, color_replace_table)
 
-            # Add all .ttf font files from this directory
-            for font_file in dir.entryList(["*.ttf"], QDir.Filter.Files):
-                font_path = dir.absoluteFilePath(font_file)
-                QFontDatabase.addApplicationFont(font_path)
+        output_filename = output_dir / svg_path.name
+        try:
+            _write_bytes_atomic(output_filename, content)
+        except OSError as e:
+            raise ResourceGeneratorError(f"Failed to open output file: {output_filename}") from e
 
 
+    @staticmethod
     def __generate_resources_for(
-        self, sub_dir: str, json_object: Dict[str, Any], entries: List[QFileInfo]
+        output_dir: Path,
+        color_replace_table: "tCompiledColorReplaceList",
+        svg_files: List[str],
+        executor: Executor,
+        is_cancelled: Optional[Callable[[], bool]] = None,
     ) -> None:
         """
-        Generate resources for various states from JSON and file entries.
+        Write recolored copies of the given SVG files into output_dir. The
+        files are processed in parallel by the given executor. Remaining files
+        are skipped once is_cancelled returns True.
 
         Raises:
             ResourceGenerationError: If resource output folder creation, reading SVGs, or writing output fails.
         """
-        output_dir = self.current_style_output_path() / sub_dir
         if not QDir().mkpath(str(output_dir)):
             raise ResourceGeneratorError(f"Error creating resource output folder: {output_dir}")
 
-        color_replace_list = self.__parse_color_replace_list(json_object)
+        generate = QtAdvancedStylesheet.__generate_resource_file
+        futures = [
+            executor.submit(generate, svg_file, output_dir, color_replace_table, is_cancelled)
+            for svg_file in svg_files
+        ]
+        # Propagate the first error in file order
+        for future in futures:
+            future.result()
 
-        for entry in entries:
-            svg_file = QFile(entry.absoluteFilePath())
-            if not svg_file.open(QIODevice.OpenModeFlag.ReadOnly):
-                raise ResourceGeneratorError(f"Failed to open SVG file: {entry.fileName()}")
 
-            content = svg_file.readAll()
-            svg_file.close()
+    @staticmethod
+    def __generate_all_resources(
+        resource_jobs: List["tResourceJob"],
+        svg_files: List[str],
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """
+        Run all resource generation jobs. SVG files are read, recolored and
+        written on a thread pool, which mostly overlaps the file I/O. The
+        remaining work is skipped once is_cancelled returns True.
 
-            self.replace_svg_colors(content, color_replace_list)
+        Raises:
+            ResourceGenerationError: If generating resources for a given group fails.
+        """
+        with ThreadPoolExecutor() as executor:
+            for group_name, output_dir, color_replace_table in resource_jobs:
+                if is_cancelled is not None and is_cancelled():
+                    return
+                try:
+                    QtAdvancedStylesheet.__generate_resources_for(
+                        output_dir, color_replace_table, svg_files, executor, is_cancelled
+                    )
+                except Exception as e:
+                    # wrap lower-level exception if necessary
+                    raise ResourceGeneratorError(f"Failed to generate resources for '{group_name}': {e}") from e
 
-            output_filename = output_dir / entry.fileName()
-            output_file = QFile(output_filename)
-            if not output_file.open(QIODevice.OpenModeFlag.WriteOnly):
-                raise ResourceGeneratorError(f"Failed to open output file: {output_filename}")
 
-            output_file.write(content)
-            output_file.close()
-    
+    def __resource_jobs(self) -> Tuple[List["tResourceJob"], List[str]]:
+        """
+        Collect the resource generation jobs from the 'resources' section of
+        the style JSON, resolved against the current theme.
+
+        Returns:
+            Tuple: The resource jobs and the paths of the SVG resource templates.
+
+        Raises:
+            StyleJsonError: If the JSON is missing the 'resources' key or any
+                            resource definition is invalid.
+        """
+        resource_dir = QDir(self.path(self.Location.RESOURCE_TEMPLATES_LOCATION))
+        entries: List[QFileInfo] = resource_dir.entryInfoList(["*.svg"], QDir.Filter.Files)
+        svg_files = [entry.absoluteFilePath() for entry in entries]
+
+        jresources: Dict[str, Any] = self.json_style_param.get("resources", {})
+        if not jresources:
+            raise StyleJsonError("Key 'resources' missing in style JSON file")
+
+        resource_jobs: List[tResourceJob] = []
+        output_path = self.current_style_output_path()
+        for group_name, params in jresources.items():
+            if not isinstance(params, dict) or not params:
+                raise StyleJsonError(f"Key 'resources' missing or empty for '{group_name}'")
+            color_replace_table = self.compile_color_replace_list(
+                self.__parse_color_replace_list(params)
+            )
+            resource_jobs.append((group_name, output_path / group_name, color_replace_table))
+        return resource_jobs, svg_files
+
+    @staticmethod
+    def __replace_colors(content: QByteArray, color_replace_table: "tCompiledColorReplaceList") -> None:
+        """
+        Replace all template colors in content with their theme colors in a
+        single pass over the buffer.
+
+        Args:
+            content (QByteArray): The content to modify in place.
+            color_replace_table (tCompiledColorReplaceList): Compiled replacements
+                as returned by `compile_color_replace_list`.
+        """
+        data = content.data()
+        result = QtAdvancedStylesheet.__replace_colors_in_bytes(data, color_replace_table)
+        if result is not data:
+            content.clear()
+            content.append(result)
+
     @staticmethod
-    def __replace_color(content: QByteArray, template_color: str, theme_color: str) -> None:
+    def __replace_colors_in_bytes(data: bytes, color_replace_table: "tCompiledColorReplaceList") -> bytes:
         """
-        Replace all occurrences of template_color in content with theme_color.
+        Replace all template colors in data with their theme colors.
 
         Args:
-            content (bytes): The content to modify.
-            template_color (str): The color string to replace.
-            theme_color (str): The replacement color string.
+            data (bytes): The content to process.
+            color_replace_table (tCompiledColorReplaceList): Compiled replacements
+                as returned by `compile_color_replace_list`.
 
         Returns:
-            bytes: The modified content.
+            bytes: The processed content, or data itself if no template color occurs in it.
         """
-        content.replace(template_color.encode('latin1'), theme_color.encode('latin1'))
-        return
+        pattern, table = color_replace_table
+        if pattern is None or pattern.search(data) is None:
+            return data
+        return pattern.sub(lambda m: table[m.group(0).lower()], data)
+
+
+    def __icon_color_replace_table(self) -> "tCompiledColorReplaceList":
+        """
+        Get the compiled icon color replace list for the current theme.
+
+        The list is built on first use from the "icon_colors" section of the
+        style JSON and compiled once, so that every themed icon is recolored
+        in a single pass without re-encoding the colors.
+        """
+        if self._icon_color_replace_table is None:
+            if not self._icon_color_replace_list:
+                icon_colors = self.json_style_param.get("icon_colors", {})
+                if isinstance(icon_colors, dict):
+                    self._icon_color_replace_list = self.__parse_color_replace_list(icon_colors)
+            self._icon_color_replace_table = self.compile_color_replace_list(
+                self._icon_color_replace_list
+            )
+        return self._icon_color_replace_table
 
 
     def __parse_palette_from_json(self) -> None:
@@ -623,6 +1085,10 @@ class QtAdvancedStylesheet(QObject):
         """
         self.palette_base_color = ""
         self.palette_colors.clear()
+        self._palette_groups = ()
+        self._palette_roles = ()
+        self._palette_variables = ()
+        self._valid_palette_entries = ()
 
         palette = self.json_style_param.get("palette", {})
         if not palette:
@@ -633,6 +1099,28 @@ class QtAdvancedStylesheet(QObject):
         self.__parse_palette_color_group(palette, QPalette.ColorGroup.Disabled)
         self.__parse_palette_color_group(palette, QPalette.ColorGroup.Inactive)
 
+        self._palette_groups = tuple(entry.group for entry in self.palette_colors)
+        self._palette_roles = tuple(entry.role for entry in self.palette_colors)
+        self._palette_variables = tuple(entry.color_variable for entry in self.palette_colors)
+        self.__resolve_palette_entries()
+
+
+    def __resolve_palette_entries(self) -> None:
+        """
+        Resolve the palette entries of the style against the colors of the
+        current theme. Entries without a valid color are dropped, so that
+        generate_theme_palette can set all remaining colors unconditionally.
+        """
+        get_color = self._color_map.get
+        entries = []
+        for group, role, color_variable in zip(
+            self._palette_groups, self._palette_roles, self._palette_variables
+        ):
+            color = get_color(color_variable)
+            if color is not None and color.isValid():
+                entries.append((group, role, color))
+        self._valid_palette_entries = tuple(entries)
+
 
     def __parse_palette_color_group(self, j_palette: Dict[str, Any], color_group: QPalette.ColorGroup) -> None:
         """
@@ -688,11 +1176,84 @@ class QtAdvancedStylesheet(QObject):
             - Populates the `_styles` attribute with the names of all subdirectories within the given directory.
         """
         path = Path(dir_path)
-        if not path.is_dir():
-            raise NotADirectoryError(f"The given path '{path}' is not a directory.")
+        try:
+            with os.scandir(path) as it:
+                styles = [e.name for e in it if e.is_dir()]
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise NotADirectoryError(f"The given path '{path}' is not a directory.") from e
 
         self.styles_dir = path
-        self.styles = [p.name for p in path.iterdir() if p.is_dir()]
+        self.styles = styles
+        self._theme_file_cache.clear()
+
+
+    def __invalidate_path_cache(self) -> None:
+        """
+        Drop all cached style paths. Called whenever styles_dir, output_dir or
+        current_style changes.
+        """
+        self._current_style_path_cache = None
+        self._output_path_cache = None
+        self._location_path_cache.clear()
+        self._style_dir_dirty = True
+
+
+    def __style_files_mtime(self) -> Optional[Tuple[float, float, float]]:
+        """
+        Get the modification times of the folder, the JSON file and the themes
+        folder of the current style.
+
+        Returns:
+            Optional[Tuple[float, float, float]]: The modification times, or None
+                                                  if one of them does not exist.
+        """
+        try:
+            return (
+                os.path.getmtime(self.current_style_path()),
+                os.path.getmtime(self._style_json_file),
+                os.path.getmtime(self.path(self.Location.THEMES_LOCATION)),
+            )
+        except OSError:
+            return None
+
+
+    @property
+    def styles_dir(self) -> Path:
+        """
+        The directory that contains the style subdirectories.
+        """
+        return self._styles_dir
+
+    @styles_dir.setter
+    def styles_dir(self, value: Union[str, Path]) -> None:
+        self._styles_dir = Path(value)
+        self.__invalidate_path_cache()
+
+
+    @property
+    def output_dir(self) -> str:
+        """
+        The directory where generated stylesheets and resources are stored.
+        """
+        return self._output_dir
+
+    @output_dir.setter
+    def output_dir(self, value: str) -> None:
+        self._output_dir = value
+        self.__invalidate_path_cache()
+
+
+    @property
+    def current_style(self) -> str:
+        """
+        The name of the current style.
+        """
+        return self._current_style
+
+    @current_style.setter
+    def current_style(self, value: str) -> None:
+        self._current_style = value
+        self.__invalidate_path_cache()
 
 
     def current_style_path(self) -> Path:
@@ -702,7 +1263,9 @@ class QtAdvancedStylesheet(QObject):
         Returns:
             Path: Absolute path to the current style.
         """
-        return Path(self.styles_dir) / self.current_style
+        if self._current_style_path_cache is None:
+            self._current_style_path_cache = Path(self.styles_dir) / self.current_style
+        return self._current_style_path_cache
 
 
     def path(self, location: Location) -> Path:
@@ -715,14 +1278,20 @@ class QtAdvancedStylesheet(QObject):
         Returns:
             Path: The absolute path corresponding to the location.
         """
-        paths = {
-            self.Location.THEMES_LOCATION: "themes",
-            self.Location.RESOURCE_TEMPLATES_LOCATION: "resources",
-            self.Location.FONTS_LOCATION: "fonts",
-        }
+        path = self._location_path_cache.get(location)
+        if path is None:
+            paths = {
+                self.Location.THEMES_LOCATION: "themes",
+                self.Location.RESOURCE_TEMPLATES_LOCATION: "resources",
+                self.Location.FONTS_LOCATION: "fonts",
+            }
 
-        subdir = paths.get(location)
-        return Path(self.current_style_path()) / subdir if subdir else Path()
+            subdir = paths.get(location)
+            if not subdir:
+                return Path()
+            path = self.current_style_path() / subdir
+            self._location_path_cache[location] = path
+        return path
 
 
     def current_style_output_path(self) -> Path:
@@ -732,7 +1301,25 @@ class QtAdvancedStylesheet(QObject):
         Returns:
             Path: Output path for the current style.
         """
-        return Path(self.output_dir) / self.current_style
+        if self._output_path_cache is None:
+            self._output_path_cache = Path(self.output_dir) / self.current_style
+        return self._output_path_cache
+
+    @property
+    def theme_variables(self) -> Dict[str, str]:
+        """
+        All theme variables, i.e. the style variables merged with the theme
+        colors. The dictionary is built on request - modifying it has no
+        effect, use `set_theme_variable_value` instead.
+
+        Returns:
+            Dict[str, str]: Mapping of variable identifiers to values.
+        """
+        return {
+            **self.style_variables,
+            **self._theme_variable_overrides,
+            **self.theme_color_variables,
+        }
 
     def theme_variable_value(self, variable_id: str) -> str:
         """
@@ -744,7 +1331,12 @@ class QtAdvancedStylesheet(QObject):
         Returns:
             str: Variable value or empty string if not found.
         """
-        return self.theme_variables.get(variable_id, "")
+        value = self.theme_color_variables.get(variable_id)
+        if value is None:
+            value = self._theme_variable_overrides.get(variable_id)
+        if value is None:
+            value = self.style_variables.get(variable_id, "")
+        return value
 
     def set_theme_variable_value(self, variable_id: str, value: str) -> None:
         """
@@ -754,13 +1346,19 @@ class QtAdvancedStylesheet(QObject):
             variable_id (str): The theme variable identifier.
             value (str): The new value to assign.
         """
-        self.theme_variables[variable_id] = value
         if variable_id in self.theme_color_variables:
             self.theme_color_variables[variable_id] = value
+            self._color_map[variable_id] = QColor(value)
+            self._palette_cache.pop(self.__palette_cache_key(), None)
+            self._theme_colors_modified = True
+            self.__resolve_palette_entries()
+        else:
+            self._theme_variable_overrides[variable_id] = value
 
     def theme_color(self, variable_id: str) -> QColor:
         """
         Get a QColor from the theme's color mapping by variable ID.
+        The colors are converted once when the theme is loaded.
 
         Args:
             variable_id (str): The color variable identifier.
@@ -768,10 +1366,20 @@ class QtAdvancedStylesheet(QObject):
         Returns:
             QColor: The corresponding color, or an invalid QColor if not found.
         """
-        color_string = self.theme_color_variables.get(variable_id, "")
-        if not color_string:
-            return QColor()  # Invalid color
-        return QColor(color_string)
+        color = self._color_map.get(variable_id)
+        return QColor(color) if color is not None else QColor()  # Invalid color
+
+
+    @staticmethod
+    def __normalize_newlines(template: str) -> str:
+        """
+        Apply the newline handling of the Jinja2 lexer to a template that is
+        not rendered by Jinja2, so that the output is identical: all line
+        breaks become "\\n" and a single trailing line break is removed.
+        """
+        if "\r" in template:
+            template = _JINJA2_NEWLINE_RE.sub("\n", template)
+        return template[:-1] if template.endswith("\n") else template
 
 
     def process_stylesheet_template(self, template: str, output_file: str = "") -> str:
@@ -786,10 +1394,17 @@ class QtAdvancedStylesheet(QObject):
         Returns:
             str: The processed stylesheet content.
         """
-        # Perform variable replacement in the template
-        template_name = "stylesheet_template"
-        loader = jinja2.DictLoader({template_name : template})
-        stylesheet = self.__render_stylesheet_template(template_name, loader)
+        # Perform variable replacement in the template. Fragments without
+        # any Jinja2 markup are returned unchanged, which skips compiling and
+        # rendering a Jinja2 template.
+        if not any(marker in template for marker in _JINJA2_MARKERS):
+            stylesheet = self.__normalize_newlines(template)
+        else:
+            template_name = "stylesheet_template"
+            self._jinja2_string_loader.mapping[template_name] = template
+            stylesheet = self.__render_stylesheet_template(
+                template_name, self._jinja2_string_environment
+            )
 
         # If an output filename was provided, store the stylesheet
         if output_file:
@@ -814,28 +1429,44 @@ class QtAdvancedStylesheet(QObject):
         return self.icon
 
 
+    def __palette_cache_key(self) -> Tuple[str, str, Optional[Tuple[str, float]]]:
+        """
+        Get the palette cache key for the current style, theme and theme file.
+        """
+        return (self._current_style, self._current_theme, self._theme_file_key)
+
+
     def generate_theme_palette(self) -> QPalette:
         """
         Generate a QPalette based on the current theme's palette configuration.
+        Palettes are cached per style, theme and theme file modification time.
 
         Returns:
             QPalette: The theme-based color palette.
         """
-        app = QApplication.instance()
-        if isinstance(app, QApplication):
+        cache_key = self.__palette_cache_key()
+        cached = self._palette_cache.get(cache_key)
+        if cached is not None:
+            return QPalette(cached)
+
+        app = self.__application()
+        if app is not None:
             palette: QPalette = app.palette()
         else:
             palette: QPalette = QPalette()
 
+        get_color = self._color_map.get
         if self.palette_base_color:
-            color: QColor = self.theme_color(self.palette_base_color)
-            if color.isValid():
+            color = get_color(self.palette_base_color)
+            if color is not None and color.isValid():
                 palette = QPalette(color)
 
-        for entry in self.palette_colors:
-            color = self.theme_color(entry.color_variable)
-            if color.isValid():
-                palette.setColor(entry.group, entry.role, color)
+        # QPalette.setColor copies the color, so the resolved colors are used directly
+        set_color = palette.setColor
+        for group, role, color in self._valid_palette_entries:
+            set_color(group, role, color)
+        if not self._theme_colors_modified:
+            self._palette_cache[cache_key] = QPalette(palette)
         return palette
 
     def style_parameters(self) -> Dict[str, Any]:
@@ -856,6 +1487,24 @@ class QtAdvancedStylesheet(QObject):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def compile_color_replace_list(color_replace_list: tColorReplaceList) -> "tCompiledColorReplaceList":
+        """
+        Pre-encode a color replace list so that it can be applied to SVG data
+        in a single pass.
+
+        Args:
+            color_replace_list (List[Tuple[str, str]]): List of color replacements.
+
+        Returns:
+            tCompiledColorReplaceList: A case-insensitive alternation pattern matching
+                all template colors (None if the list is empty) and a lower case
+                template -> theme color table.
+        """
+        return _compile_color_replace_list(
+            tuple((template_color, theme_color) for template_color, theme_color in color_replace_list)
+        )
+
     @staticmethod
     def replace_colors_in_svg(svg_content: QByteArray, color_replace_list: tColorReplaceList) -> None:
         """
@@ -865,8 +1514,9 @@ class QtAdvancedStylesheet(QObject):
             svg_content (QByteArray): The SVG data to modify.
             color_replace_list (List[Tuple[str, str]]): List of color replacements.
         """
-        for template_color, theme_color in color_replace_list:
-            QtAdvancedStylesheet.__replace_color(svg_content, template_color, theme_color)
+        QtAdvancedStylesheet.__replace_colors(
+            svg_content, QtAdvancedStylesheet.compile_color_replace_list(color_replace_list)
+        )
 
     def replace_svg_colors(
         self,
@@ -880,9 +1530,11 @@ class QtAdvancedStylesheet(QObject):
             svg_content (QByteArray): The SVG data to modify.
             color_replace_list (Optional[List[Tuple[str, str]]]): Optional list of color replacements.
         """
-        color_replace_list = color_replace_list or self._icon_color_replace_list
-        for template_color, theme_color in color_replace_list:
-            self.__replace_color(svg_content, template_color, theme_color)
+        if color_replace_list:
+            table = self.compile_color_replace_list(color_replace_list)
+        else:
+            table = self.__icon_color_replace_table()
+        self.__replace_colors(svg_content, table)
             
 
     def load_theme_aware_svg_icon(self, filename: str) -> QIcon:
@@ -893,9 +1545,22 @@ class QtAdvancedStylesheet(QObject):
             filename (str): Path to the SVG file.
 
         Returns:
-            QIcon: The themed SVG icon.
+            QIcon: The themed SVG icon. Icons are cached per filename, so that all
+                   users of an icon share one engine and its pixmap cache.
         """
-        raise NotImplementedError
+        icon = self._theme_aware_icon_cache.get(filename)
+        if icon is not None:
+            return icon
+
+        svg_file = QFile(filename)
+        if not svg_file.open(QIODevice.ReadOnly):
+            return QIcon()
+        content = svg_file.readAll()
+        svg_file.close()
+
+        icon = QIcon(SvgIconEngine(content, self))
+        self._theme_aware_icon_cache[filename] = icon
+        return icon
 
     # Slots
 
@@ -916,7 +1581,8 @@ class QtAdvancedStylesheet(QObject):
             return False
 
         self._current_theme = theme
-        self.current_theme_changed.emit(self._current_theme)
+        if self.receivers(self._CURRENT_THEME_CHANGED_SIGNATURE):
+            self.current_theme_changed.emit(self._current_theme)
         return True
 
 
@@ -927,7 +1593,7 @@ class QtAdvancedStylesheet(QObject):
         self.set_current_theme(self.default_theme)
 
 
-    def set_current_style(self, style: str) -> None:
+    def set_current_style(self, style: str) -> bool:
         """
         Set the current style and trigger related updates.
 
@@ -937,15 +1603,36 @@ class QtAdvancedStylesheet(QObject):
         Returns:
             bool: True if the style was successfully loaded, False otherwise.
         """
+        # Nothing to do if the style is already loaded and unchanged on disk
+        if (
+            style == self._current_style
+            and self.themes
+            and not self._style_dir_dirty
+            and self._style_files_mtime is not None
+            and self.__style_files_mtime() == self._style_files_mtime
+        ):
+            return True
+
         self.current_style = style
-        themes_path = Path(self.path(self.Location.THEMES_LOCATION))
-        xml_files = themes_path.glob("*.xml")
-        self.themes: List[str] = [f.stem for f in xml_files]
+        try:
+            with os.scandir(self.path(self.Location.THEMES_LOCATION)) as it:
+                self.themes = [
+                    e.name[:-4] for e in it if e.name.endswith(".xml") and e.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            self.themes = []
         self.__parse_style_json_file()
-        QDir.addSearchPath("icon", self.current_style_output_path())
+        icon_search_path = str(self.current_style_output_path())
+        if icon_search_path not in self._registered_icon_search_paths:
+            QDir.addSearchPath("icon", icon_search_path)
+            self._registered_icon_search_paths.add(icon_search_path)
         self.__add_fonts()
-        self.current_style_changed.emit(self.current_style)
-        self.stylesheet_changed.emit()
+        self._style_files_mtime = self.__style_files_mtime()
+        self._style_dir_dirty = False
+        if self.receivers(self._CURRENT_STYLE_CHANGED_SIGNATURE):
+            self.current_style_changed.emit(self.current_style)
+        self.__emit_stylesheet_changed()
+        return True
 
 
     def update_stylesheet(self) -> None:
@@ -953,14 +1640,116 @@ class QtAdvancedStylesheet(QObject):
         Update the stylesheet by processing the style template, refreshing icons,
         and generating the final stylesheet. Emits `stylesheetChanged` signal upon success.
 
+        The update is skipped if style, theme, theme variables, stylesheet
+        template and output folder are unchanged since the last successful update.
+
         Returns:
             bool: True if the stylesheet was updated successfully, False otherwise.
         """
+        cache_key, _, _, output_filename = self.__stylesheet_job()
+        fingerprint = (
+            self._current_style,
+            self._current_theme,
+            self._style_generation,
+            cache_key,
+            output_filename,
+        )
+        if fingerprint == self._last_stylesheet_fingerprint:
+            return
+
+        # Supersede pending asynchronous updates
+        self._async_update_serial += 1
         self.process_style_template()
         self._icon_color_replace_list.clear()
+        self._icon_color_replace_table = None
         SvgIconEngine.update_all_icons()
         self.__generate_stylesheet()
-        self.stylesheet_changed.emit()
+        self._last_stylesheet_fingerprint = fingerprint
+        self.__emit_stylesheet_changed()
+
+
+    def update_stylesheet_async(self) -> None:
+        """
+        Asynchronous variant of `update_stylesheet`.
+
+        The application palette and theme-aware icons are updated immediately.
+        Generating the SVG resources and rendering and exporting the stylesheet
+        run on the global QThreadPool. When done, `stylesheet` is updated and
+        `stylesheet_changed` is emitted from the thread of this object. On
+        failure, `stylesheet_update_failed` is emitted with the error message.
+
+        Updates write their files one at a time. Files are replaced atomically,
+        and an update that is superseded by a newer one stops writing files,
+        so the output folder always holds complete files.
+        """
+        self._last_stylesheet_fingerprint = None
+        self.update_application_palette_colors()
+        resource_jobs, svg_files = self.__resource_jobs()
+        self._icon_color_replace_list.clear()
+        self._icon_color_replace_table = None
+        SvgIconEngine.update_all_icons()
+
+        cache_key, env, template, output_filename = self.__stylesheet_job()
+        variables = self.theme_variables
+        stylesheet = self.__cached_stylesheet(cache_key)
+
+        self._async_update_serial += 1
+        serial = self._async_update_serial
+
+        def is_superseded() -> bool:
+            return serial != self._async_update_serial
+
+        def run() -> None:
+            # Jobs run one at a time. A superseded job stops writing files, the
+            # newer update writes them all again.
+            try:
+                with self._output_lock:
+                    if is_superseded():
+                        return
+                    self.__generate_all_resources(resource_jobs, svg_files, is_superseded)
+                    if is_superseded():
+                        return
+                    css = stylesheet
+                    if css is None:
+                        css = self.__render_stylesheet_template(template, env, variables)
+                    self.__export_stylesheet(css, cache_key, output_filename)
+            except Exception as e:
+                self._async_update_failed.emit(serial, str(e))
+                return
+            self._async_update_finished.emit(serial, css)
+
+        self._pending_stylesheet_cache_key = cache_key
+        QThreadPool.globalInstance().start(run)
+
+
+    def __emit_stylesheet_changed(self) -> None:
+        """
+        Emit `stylesheet_changed` if any receiver is connected to it.
+        """
+        if self.receivers(self._STYLESHEET_CHANGED_SIGNATURE):
+            self.stylesheet_changed.emit()
+
+
+    @Slot(int, str)
+    def __on_async_update_finished(self, serial: int, stylesheet: str) -> None:
+        """
+        Apply the result of an asynchronous stylesheet update.
+        """
+        if serial != self._async_update_serial:
+            return
+        self.__cache_stylesheet(self._pending_stylesheet_cache_key, stylesheet)
+        self.stylesheet = stylesheet
+        self.__emit_stylesheet_changed()
+
+
+    @Slot(int, str)
+    def __on_async_update_failed(self, serial: int, message: str) -> None:
+        """
+        Report the failure of an asynchronous stylesheet update.
+        """
+        if serial != self._async_update_serial:
+            return
+        self.stylesheet_update_failed.emit(message)
 
 
     def process_style_template(self) -> None:
@@ -984,26 +1773,30 @@ class QtAdvancedStylesheet(QObject):
                             resource definition is invalid.
             ResourceGenerationError: If generating resources for a given group fails.
         """
-        resource_dir = QDir(self.path(self.Location.RESOURCE_TEMPLATES_LOCATION))
-        entries: List[QFileInfo] = resource_dir.entryInfoList(["*.svg"], QDir.Filter.Files)
-
-        jresources: Dict[str, Any] = self.json_style_param.get("resources", {})
-        if not jresources:
-            raise StyleJsonError("Key 'resources' missing in style JSON file")
-
-        for group_name, params in jresources.items():
-            if not isinstance(params, dict) or not params:
-                raise StyleJsonError(f"Key 'resources' missing or empty for '{group_name}'")
-            try:
-                self.__generate_resources_for(group_name, params, entries)
-            except Exception as e:
-                # wrap lower-level exception if necessary
-                raise ResourceGeneratorError(f"Failed to generate resources for '{group_name}': {e}") from e
+        resource_jobs, svg_files = self.__resource_jobs()
+        with self._output_lock:
+            self.__generate_all_resources(resource_jobs, svg_files)
 
     def update_application_palette_colors(self) -> None:
         """
         Update the application's palette colors using the generated theme palette.
         """
-        app = QApplication.instance()
-        if isinstance(app, QApplication):  # Ensure it's a QApplication
+        app = self.__application()
+        if app is not None:
             app.setPalette(self.generate_theme_palette())
+
+
+    def __application(self) -> Optional[QApplication]:
+        """
+        Get the QApplication instance. The instance is cached as soon as one
+        exists, because a style may be created before the application.
+
+        Returns:
+            Optional[QApplication]: The application, or None if there is no
+                                    QApplication (e.g. only a QCoreApplication).
+        """
+        if self._app is None:
+            app = QApplication.instance()
+            if isinstance(app, QApplication):
+                self._app = app
+        return self._app
@@ -2,8 +2,11 @@ import logging
 from rich.traceback import install as install_rich_traceback
 from rich.logging import RichHandler
 import qtass
+import os
 import sys
+import PySide6
 from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer
 
 
 
@@ -18,7 +21,9 @@ def setup_logging():
         datefmt="[%X]",
         handlers=[RichHandler(rich_tracebacks=True, )]
     )
-    install_rich_traceback(show_locals=True)
+    # Capturing locals is costly with large Qt objects, so it is opt-in
+    show_locals = bool(os.environ.get("QTASS_RICH_TB"))
+    install_rich_traceback(show_locals=show_locals, suppress=[PySide6])
 
 
 def test_qtass():
@@ -34,10 +39,45 @@ def test_qtass():
     style.update_stylesheet()
 
 
+def test_qtass_async(app: QApplication):
+    """
+    Test function for the asynchronous stylesheet update of the QtAdvancedStylesheet class.
+    """
+    style = qtass.QtAdvancedStylesheet()
+    style.set_styles_dir_path("styles")
+    style.output_dir = "build/style_output_async"
+    style.set_current_style("material")
+    style.set_default_theme()
+
+    def on_stylesheet_changed():
+        print("Asynchronous update finished, stylesheet size:", len(style.stylesheet))
+        app.quit()
+
+    def on_stylesheet_update_failed(message: str):
+        print("Asynchronous update failed:", message)
+        app.exit(1)
+
+    # Connect after set_current_style(), which emits stylesheet_changed too
+    style.stylesheet_changed.connect(on_stylesheet_changed)
+    style.stylesheet_update_failed.connect(on_stylesheet_update_failed)
+    # Only the last of several rapid updates delivers its result
+    style.update_stylesheet_async()
+    style.update_stylesheet_async()
+
+    def on_timeout():
+        print("Asynchronous update timed out")
+        app.exit(2)
+
+    # Fail instead of blocking forever if no result is delivered
+    QTimer.singleShot(30000, app, on_timeout)
+    return app.exec()
+
+
 def main():
     setup_logging()
     app = QApplication(sys.argv)
     test_qtass()
+    return test_qtass_async(app)
 
 
 if __name__ == "__main__":